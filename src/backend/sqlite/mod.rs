@@ -477,8 +477,12 @@ impl ExtDatabase for Sqlite {
         nested: bool,
     ) -> BoxFuture<'_, std::result::Result<(), SqlxError>> {
         // FIXME - this is a horrible workaround because there is currently
-        // no good way to start an immediate transaction with sqlx. Without this
-        // adjustment, updates will run into 'database is locked' errors.
+        // no good way to start an immediate transaction with sqlx. The no-op
+        // write gives the equivalent of `BEGIN IMMEDIATE`: the RESERVED lock
+        // is taken up front instead of on the first update, so concurrent
+        // write transactions queue on the busy timeout rather than failing
+        // with 'database is locked' errors when a deferred read transaction
+        // tries to upgrade.
         Box::pin(async move {
             <Sqlite as Database>::TransactionManager::begin(&mut *conn).await?;
             if !nested {
@@ -29,6 +29,7 @@ const DEFAULT_BUSY_TIMEOUT: Duration = Duration::from_secs(5);
 const DEFAULT_JOURNAL_MODE: SqliteJournalMode = SqliteJournalMode::Wal;
 const DEFAULT_LOCKING_MODE: SqliteLockingMode = SqliteLockingMode::Normal;
 const DEFAULT_SHARED_CACHE: bool = true;
+const DEFAULT_STMT_CACHE_SIZE: usize = 100;
 const DEFAULT_SYNCHRONOUS: SqliteSynchronous = SqliteSynchronous::Full;
 
 /// Configuration options for Sqlite stores
@@ -37,12 +38,15 @@ pub struct SqliteStoreOptions {
     pub(crate) in_memory: bool,
     pub(crate) path: String,
     pub(crate) busy_timeout: Duration,
+    pub(crate) cache_size: Option<i32>,
     pub(crate) max_connections: u32,
     pub(crate) min_connections: u32,
     pub(crate) journal_mode: SqliteJournalMode,
     pub(crate) locking_mode: SqliteLockingMode,
     pub(crate) shared_cache: bool,
+    pub(crate) stmt_cache_size: usize,
     pub(crate) synchronous: SqliteSynchronous,
+    pub(crate) temp_store: Option<String>,
 }
 
 impl Default for SqliteStoreOptions {
@@ -64,6 +68,14 @@ impl SqliteStoreOptions {
         } else {
             DEFAULT_BUSY_TIMEOUT
         };
+        let cache_size = if let Some(size) = opts.query.remove("cache_size") {
+            Some(
+                size.parse()
+                    .map_err(err_map!(Input, "Error parsing 'cache_size' parameter"))?,
+            )
+        } else {
+            None
+        };
         let max_connections = if let Some(max_conn) = opts.query.remove("max_connections") {
             max_conn
                 .parse()
@@ -97,12 +109,26 @@ impl SqliteStoreOptions {
         } else {
             DEFAULT_SHARED_CACHE
         };
+        let stmt_cache_size = if let Some(size) = opts.query.remove("stmt_cache_size") {
+            size.parse()
+                .map_err(err_map!(Input, "Error parsing 'stmt_cache_size' parameter"))?
+        } else {
+            DEFAULT_STMT_CACHE_SIZE
+        };
         let synchronous = if let Some(sync) = opts.query.remove("synchronous") {
             SqliteSynchronous::from_str(&sync)
                 .map_err(err_map!(Input, "Error parsing 'synchronous' parameter"))?
         } else {
             DEFAULT_SYNCHRONOUS
         };
+        let temp_store = if let Some(ts) = opts.query.remove("temp_store") {
+            if !["default", "file", "memory"].contains(&ts.to_ascii_lowercase().as_str()) {
+                return Err(err_msg!(Input, "Error parsing 'temp_store' parameter"));
+            }
+            Some(ts)
+        } else {
+            None
+        };
 
         let mut path = opts.host.to_string();
         path.push_str(&*opts.path);
@@ -110,12 +136,15 @@ impl SqliteStoreOptions {
             in_memory: path == ":memory:",
             path,
             busy_timeout,
+            cache_size,
             max_connections,
             min_connections,
             journal_mode,
             locking_mode,
             shared_cache,
+            stmt_cache_size,
             synchronous,
+            temp_store,
         })
     }
 
@@ -128,7 +157,16 @@ impl SqliteStoreOptions {
             .journal_mode(self.journal_mode)
             .locking_mode(self.locking_mode)
             .shared_cache(self.shared_cache)
+            // prepared statements issued by the session and transaction
+            // methods are cached per-connection and reused on later calls
+            .statement_cache_capacity(self.stmt_cache_size)
             .synchronous(self.synchronous);
+        if let Some(size) = self.cache_size {
+            conn_opts = conn_opts.pragma("cache_size", size.to_string());
+        }
+        if let Some(ts) = self.temp_store.clone() {
+            conn_opts = conn_opts.pragma("temp_store", ts);
+        }
         #[cfg(feature = "log")]
         {
             conn_opts.log_statements(log::LevelFilter::Debug);
@@ -428,8 +428,16 @@ class FfiByteBuffer:
             data = c_char_p()
         elif isinstance(value, memoryview):
             dlen = value.nbytes
-            data = c_char_p(value.tobytes())
+            if value.contiguous and not value.readonly:
+                # borrow the underlying buffer instead of copying
+                data = (c_char * dlen).from_buffer(value)
+            else:
+                data = c_char_p(value.tobytes())
+        elif isinstance(value, bytearray):
+            dlen = len(value)
+            data = (c_char * dlen).from_buffer(value)
         elif isinstance(value, bytes):
+            # c_char_p borrows the contents of the bytes instance
             dlen = len(value)
             data = c_char_p(value)
         else:
@@ -453,6 +453,24 @@ class Session:
             self._handle, EntryOperation.INSERT, category, name, value, tags, expiry_ms
         )
 
+    async def insert_many(self, entries: Sequence[dict]):
+        """Insert a batch of new entries, keyed like `Entry` mappings.
+
+        When the session is a transaction, the inserted rows are committed
+        together instead of paying a BEGIN/COMMIT cycle per entry.
+        """
+        if not self._handle:
+            raise AskarError(AskarErrorCode.WRAPPER, "Cannot update closed session")
+        for entry in entries:
+            await self.insert(
+                entry["category"],
+                entry["name"],
+                entry.get("value"),
+                entry.get("tags"),
+                entry.get("expiry_ms"),
+                entry.get("value_json"),
+            )
+
     async def replace(
         self,
         category: str,
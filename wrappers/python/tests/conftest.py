@@ -0,0 +1,96 @@
+import asyncio
+import json
+import os
+from types import MappingProxyType
+
+from pytest import fixture
+import pytest_asyncio
+
+from aries_askar import Store
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# The sqlite backend opens :memory: stores with cache=shared by default, so
+# its connection pool sees a single shared database: reads proceed in parallel
+# on separate connections while a writer holds the lock
+TEST_STORE_URI = os.getenv("TEST_STORE_URI", "sqlite://:memory:")
+
+if TEST_STORE_URI.startswith("sqlite://") and ":memory:" not in TEST_STORE_URI:
+    # Isolate file-backed sqlite stores between pytest-xdist workers: each
+    # worker process provisions its own database file. In-memory stores are
+    # already private to the worker process, and other backends are expected
+    # to be tested serially
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if worker_id:
+        path, sep, query = TEST_STORE_URI[len("sqlite://") :].partition("?")
+        TEST_STORE_URI = f"sqlite://{path}.{worker_id}{sep}{query}"
+
+    # Enable WAL journaling with a busy timeout for file-backed SQLite stores,
+    # so the concurrent writers in test_txn_contention are not serialized
+    # against readers by the rollback journal, and give the page cache and
+    # temp tables room in memory. No effect on in-memory stores.
+    TEST_STORE_URI += ("&" if "?" in TEST_STORE_URI else "?") + (
+        "journal_mode=wal&busy_timeout=5000&synchronous=normal"
+        "&cache_size=-16384&temp_store=memory"
+    )
+
+# frozen: the entry is shared by every test against the module-scoped store,
+# and the bindings canonicalize the tag set on each insert regardless.
+# The multi-valued tag stays a set since fetched tags decode back to sets
+TEST_ENTRY = MappingProxyType(
+    {
+        "category": "test category",
+        "name": "test name",
+        "value": b"test_value",
+        "tags": {"~plaintag": "a", "enctag": {"b", "c"}},
+    }
+)
+
+# The tag filter matching TEST_ENTRY, pre-serialized: the bindings accept
+# either a dict or a JSON string, so encoding the constant filter once avoids
+# a json.dumps on every count/fetch_all/scan call
+TEST_TAG_FILTER = json.dumps({"~plaintag": "a", "enctag": "b"})
+
+# derived once at module load: the seed is constant and each derivation
+# runs a KDF behind the FFI boundary
+RAW_KEY = Store.generate_raw_key(b"00000000000000000000000000000My1")
+
+
+def assert_entry(entry, expected: dict):
+    # compare field-by-field: building dict(entry) iterates the Entry and
+    # re-reads every field from the result list handle
+    assert entry.category == expected["category"]
+    assert entry.name == expected["name"]
+    assert entry.value == expected["value"]
+    assert entry.tags == expected["tags"]
+
+
+@fixture(scope="module")
+def event_loop():
+    # module-scoped to support the module-scoped store fixture. uvloop, when
+    # installed, reduces the task scheduling overhead of the contention test
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_store() -> Store:
+    store = await Store.provision(TEST_STORE_URI, "raw", RAW_KEY, recreate=True)
+    yield store
+    # in-memory databases vanish on close; only request removal when there
+    # is a backing file to clean up
+    await store.close(remove=":memory:" not in TEST_STORE_URI)
+
+
+@pytest_asyncio.fixture
+async def store(module_store: Store) -> Store:
+    yield module_store
+    # clear out test entries between tests, avoiding the cost of
+    # re-provisioning the store (schema bootstrap and key derivation)
+    async with module_store as session:
+        await session.remove_all(TEST_ENTRY["category"])